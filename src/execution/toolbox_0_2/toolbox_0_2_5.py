@@ -2,7 +2,7 @@
 Filename: toolbox_0_2_5.py
 Description: Executes standalone operations, provides object-oriented functionality, integrates with arcgis pro tools, processes and transforms data, and handles errors and exceptions
 Author: iamchriswick
-Dependencies: arcpy, json, os, psutil, traceback
+Dependencies: arcpy, functools, json, os, psutil, traceback, types, orjson (optional)
 Version: 1.0.1
 Created: 2025-09-02 20:04:01
 Last Updated: 2025-09-02 21:00:55
@@ -46,8 +46,55 @@ Phase 2 Change Log:
 """
 
 import arcpy
+import functools
 import json
 import os
+import types
+
+# Optional faster JSON parser; falls back to the standard library
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Default IMPORT_FIELDS.json location, resolved once at import time
+_DEFAULT_IMPORT_FIELDS_PATH = os.path.normpath(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "..",
+        "..",
+        "data",
+        "IMPORT_FIELDS.json",
+    )
+)
+
+
+def load_import_fields_json(json_path=None):
+    """Load the IMPORT_FIELDS.json configuration.
+
+    Args:
+        json_path: Optional path to the JSON file (defaults to data/IMPORT_FIELDS.json)
+
+    Returns:
+        dict: Parsed IMPORT_FIELDS configuration
+
+    Raises:
+        FileNotFoundError: When the JSON file does not exist
+        json.JSONDecodeError: When the JSON file is malformed
+    """
+    if json_path is None:
+        json_path = _DEFAULT_IMPORT_FIELDS_PATH
+
+    # Checked on every call so a replaced or removed file is still detected
+    if not os.path.exists(json_path):
+        raise FileNotFoundError(f"IMPORT_FIELDS.json not found: {json_path}")
+
+    # Both parsers accept UTF-8 bytes directly
+    with open(json_path, "rb") as f:
+        return _json_loads(f.read())
 
 
 def get_field_source_mappings():
@@ -57,16 +104,11 @@ def get_field_source_mappings():
         dict: Mapping of field names to their source layer paths
     """
     try:
-        # Get the path to IMPORT_FIELDS.json relative to this script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        import_fields_path = os.path.join(
-            script_dir, "..", "..", "..", "data", "IMPORT_FIELDS.json"
-        )
+        import_fields_path = _DEFAULT_IMPORT_FIELDS_PATH
 
         arcpy.AddMessage(f"📋 Loading field mappings from: {import_fields_path}")
 
-        with open(import_fields_path, "r") as f:
-            import_fields = json.load(f)
+        import_fields = load_import_fields_json(import_fields_path)
 
         # Create field name to source path mapping
         field_mappings = {}
@@ -88,33 +130,61 @@ def get_field_source_mappings():
         return {}
 
 
-def get_system_capabilities():
-    """Get system capabilities for thread and memory configuration."""
-    try:
-        import psutil
-
-        # Get system capabilities
-        cpu_count = psutil.cpu_count(logical=True) or 4
-        memory_gb = (
-            round(psutil.virtual_memory().total / (1024**3))
-            if psutil.virtual_memory()
-            else 8
-        )
+# Returned when psutil is missing or system detection fails (never cached)
+_FALLBACK_CAPABILITIES = types.MappingProxyType(
+    {"cpu_count": 4, "memory_gb": 8, "max_threads": 3, "max_memory_gb": 7}
+)
 
-        # Apply 90% max utilization rule
-        max_threads = max(1, int(cpu_count * 0.9))
-        max_memory_gb = max(1, int(memory_gb * 0.9))
 
-        return {
+@functools.lru_cache(maxsize=1)
+def _detect_system_capabilities():
+    """Probe CPU count and total memory once per session.
+
+    Failures propagate to the caller; lru_cache does not cache exceptions, so
+    a failed probe is retried on the next call.
+
+    Returns:
+        MappingProxyType: Read-only capabilities shared by all callers
+    """
+    import psutil
+
+    # Get system capabilities
+    cpu_count = psutil.cpu_count(logical=True) or 4
+    memory_info = psutil.virtual_memory()
+    memory_gb = round(memory_info.total / (1024**3)) if memory_info else 8
+
+    # Apply 90% max utilization rule
+    max_threads = max(1, int(cpu_count * 0.9))
+    max_memory_gb = max(1, int(memory_gb * 0.9))
+
+    return types.MappingProxyType(
+        {
             "cpu_count": cpu_count,
             "memory_gb": memory_gb,
             "max_threads": max_threads,
             "max_memory_gb": max_memory_gb,
         }
+    )
+
+
+def get_system_capabilities():
+    """Get system capabilities for thread and memory configuration.
+
+    CPU count and total memory do not change while ArcGIS Pro is running, so a
+    successful detection is reused for the session (clear it with
+    _detect_system_capabilities.cache_clear()). Fallback values are returned
+    uncached, so a transient psutil failure is retried on the next call.
+
+    Returns:
+        MappingProxyType: Read-only mapping with cpu_count, memory_gb,
+                          max_threads and max_memory_gb
+    """
+    try:
+        return _detect_system_capabilities()
     except ImportError:
-        return {"cpu_count": 4, "memory_gb": 8, "max_threads": 3, "max_memory_gb": 7}
+        return _FALLBACK_CAPABILITIES
     except Exception:
-        return {"cpu_count": 4, "memory_gb": 8, "max_threads": 3, "max_memory_gb": 7}
+        return _FALLBACK_CAPABILITIES
 
 
 def get_field_info(feature_layer):
@@ -592,10 +662,13 @@ def main():
                     "✅ Output layer exists - performing CUD operations..."
                 )
 
-                # Get existing fields (excluding system fields)
+                # Get existing fields (excluding system fields), in ListFields order
                 existing_fields = [f.name for f in arcpy.ListFields(output_path)]
                 system_fields = ["OBJECTID", "Shape", "Shape_Area", "Shape_Length"]
                 user_fields = [f for f in existing_fields if f not in system_fields]
+                # Set view for the membership checks below; iteration (and so
+                # the DELETE order and its log) stays on the ordered list
+                existing_field_set = frozenset(existing_fields)
 
                 # Define our target fields from IMPORT_FIELDS (sample subset for Phase 2)
                 target_fields = ["srrtrealder", "srrtreslag", "srrbmo", "srrmhoyde"]
@@ -607,7 +680,7 @@ def main():
                 # CREATE: Add missing fields
                 fields_created = []
                 for field in target_fields:
-                    if field not in existing_fields:
+                    if field not in existing_field_set:
                         arcpy.AddMessage(f"➕ Creating field: {field}")
                         arcpy.AddField_management(
                             output_path, field, "DOUBLE", field_alias=field
@@ -618,7 +691,7 @@ def main():
                 all_target_fields = [
                     f
                     for f in target_fields
-                    if f in existing_fields or f in fields_created
+                    if f in existing_field_set or f in fields_created
                 ]
                 updated_count = 0  # Initialize counter
 
@@ -641,9 +714,9 @@ def main():
                             try:
                                 # Check if source layer exists and has the field
                                 if arcpy.Exists(source_path):
-                                    source_fields = [
+                                    source_fields = frozenset(
                                         f.name for f in arcpy.ListFields(source_path)
-                                    ]
+                                    )
                                     if field_name in source_fields:
                                         # Read data from source layer
                                         source_data = {}
@@ -40,7 +40,7 @@ The ToolValidator will provide:
 # ===== TOOLVALIDATOR CODE FOR .ATBX SCRIPT TOOL =====
 # Copy the entire ToolValidator class below to .atbx Properties → Validation:
 
-# ArcPy import deferred to method level to prevent pytest crashes
+# ArcPy import deferred to ToolValidator.__init__ to prevent pytest crashes
 import os
 
 
@@ -53,9 +53,29 @@ class ToolValidator(object):
     Enhanced GUI features will be automatically enabled.
     """
 
+    __slots__ = (
+        "params",
+        "_arcpy",
+        "_cached_cores",
+        "_cached_memory",
+        "_filters_initialized",
+        "_cached_project",
+        "_last_warning_key",
+        "_last_needs_warning",
+    )
+
+    # Dropdown label patterns mapped to their position in the filter lists
+    _THREAD_PATTERNS = (("Auto", 0), ("Moderate", 1), ("High", 2))
+    _MEM_PATTERNS = (("30%", 0), ("60%", 1), ("90%", 2))
+
+    # Output name keywords that indicate an IMPORT_FIELDS validation context
+    _VALID_KEYWORDS = ("validated", "checked", "import")
+
     def __init__(self):
         import arcpy  # Deferred import to prevent pytest crashes
 
+        # Bound once here so the lifecycle methods do not re-import arcpy
+        self._arcpy = arcpy
         self.params = (
             arcpy.GetParameterInfo()
         )  # 0=output_layer, 1=multithreading_config, 2=memory_config
@@ -63,6 +83,13 @@ class ToolValidator(object):
         # Cache system capabilities to ensure consistency across lifecycle methods
         self._cached_cores = None
         self._cached_memory = None
+        # Set once the thread/memory filter lists have been assigned
+        self._filters_initialized = False
+        # Current ArcGIS Pro project, looked up on first use
+        self._cached_project = None
+        # Last output name checked in updateMessages and whether it needs a warning
+        self._last_warning_key = None
+        self._last_needs_warning = False
 
     # --- helpers ---
     def _cpu_cores(self):
@@ -107,6 +134,21 @@ class ToolValidator(object):
             f"{aggressive} GB (90% of {avail_gb:.1f} GB available)",
         ]
 
+    def _active_map(self):
+        # The CURRENT project stays the same while the tool dialog is open, but
+        # the user can switch maps, so activeMap is read on every event
+        if self._cached_project is None:
+            try:
+                self._cached_project = self._arcpy.mp.ArcGISProject("CURRENT")
+            except Exception:
+                return None  # no project open (e.g. outside ArcGIS Pro)
+        return self._cached_project.activeMap
+
+    def _feature_layer_names(self, m):
+        return [
+            lyr.name for lyr in m.listLayers() if getattr(lyr, "isFeatureLayer", False)
+        ]
+
     # --- lifecycle ---
     def initializeParameters(self):
         # Dropdowns with default = Auto (index 0) for threading, balanced (index 1) for memory
@@ -115,19 +157,13 @@ class ToolValidator(object):
 
         self.params[2].filter.list = self._memory_labels(self._avail_mem_gb())
         self.params[2].value = self.params[2].filter.list[1]  # Balanced memory
+        self._filters_initialized = True
 
         # Populate output layer dropdown if a map is active
         try:
-            import arcpy  # Deferred import to prevent pytest crashes
-
-            aprx = arcpy.mp.ArcGISProject("CURRENT")
-            m = aprx.activeMap
+            m = self._active_map()
             if m:
-                names = [
-                    lyr.name
-                    for lyr in m.listLayers()
-                    if getattr(lyr, "isFeatureLayer", False)
-                ]
+                names = self._feature_layer_names(m)
                 if names:
                     self.params[0].filter.list = names
                     if not self.params[0].value:
@@ -141,66 +177,46 @@ class ToolValidator(object):
         current_thread_value = self.params[1].value
         current_memory_value = self.params[2].value
 
-        # Update the filter lists
-        self.params[1].filter.list = self._thread_labels(self._cpu_cores())
-        self.params[2].filter.list = self._memory_labels(self._avail_mem_gb())
+        # Assign the filter lists only once; their inputs never change in a session
+        if not self._filters_initialized:
+            self.params[1].filter.list = self._thread_labels(self._cpu_cores())
+            self.params[2].filter.list = self._memory_labels(self._avail_mem_gb())
+            self._filters_initialized = True
 
         # Try to preserve user selections by checking patterns instead of exact matches
-        if current_thread_value:
-            thread_str = str(current_thread_value)
-            # Check if it's still a valid pattern (Auto, Moderate, or High)
-            if any(pattern in thread_str for pattern in ["Auto", "Moderate", "High"]):
-                # Keep the existing selection if it matches a valid pattern
+        # Convert each parameter value to text once and branch on that
+        thread_str = "" if current_thread_value is None else str(current_thread_value)
+        if thread_str:
+            # Find the first valid pattern (Auto, Moderate, or High) in one pass
+            idx = next(
+                (i for pat, i in self._THREAD_PATTERNS if pat in thread_str), None
+            )
+            if idx is not None:
+                # Keep the existing selection if it matches exactly
                 if thread_str in self.params[1].filter.list:
                     self.params[1].value = current_thread_value
                 else:
-                    # Find equivalent option by pattern
-                    if "Auto" in thread_str:
-                        self.params[1].value = self.params[1].filter.list[
-                            0
-                        ]  # Auto is always first
-                    elif "Moderate" in thread_str:
-                        self.params[1].value = self.params[1].filter.list[
-                            1
-                        ]  # Moderate is second
-                    elif "High" in thread_str:
-                        self.params[1].value = self.params[1].filter.list[
-                            2
-                        ]  # High is third
-
-        if current_memory_value:
-            memory_str = str(current_memory_value)
-            # Check if it's still a valid pattern (30%, 60%, or 90%)
-            if any(pattern in memory_str for pattern in ["30%", "60%", "90%"]):
+                    # Otherwise select the equivalent option by position
+                    self.params[1].value = self.params[1].filter.list[idx]
+
+        memory_str = "" if current_memory_value is None else str(current_memory_value)
+        if memory_str:
+            # Find the first valid pattern (30%, 60%, or 90%) in one pass
+            idx = next(
+                (i for pat, i in self._MEM_PATTERNS if pat in memory_str), None
+            )
+            if idx is not None:
                 # Keep the existing selection if it matches exactly
                 if memory_str in self.params[2].filter.list:
                     self.params[2].value = current_memory_value
                 else:
-                    # Find equivalent option by percentage pattern
-                    if "30%" in memory_str:
-                        self.params[2].value = self.params[2].filter.list[
-                            0
-                        ]  # 30% is conservative
-                    elif "60%" in memory_str:
-                        self.params[2].value = self.params[2].filter.list[
-                            1
-                        ]  # 60% is balanced
-                    elif "90%" in memory_str:
-                        self.params[2].value = self.params[2].filter.list[
-                            2
-                        ]  # 90% is aggressive
+                    # Otherwise select the equivalent option by position
+                    self.params[2].value = self.params[2].filter.list[idx]
 
         try:
-            import arcpy  # Deferred import to prevent pytest crashes
-
-            aprx = arcpy.mp.ArcGISProject("CURRENT")
-            m = aprx.activeMap
+            m = self._active_map()
             if m:
-                self.params[0].filter.list = [
-                    lyr.name
-                    for lyr in m.listLayers()
-                    if getattr(lyr, "isFeatureLayer", False)
-                ]
+                self.params[0].filter.list = self._feature_layer_names(m)
         except Exception:
             pass
         return
@@ -212,12 +228,15 @@ class ToolValidator(object):
 
             # Phase 2 ADDITION: IMPORT_FIELDS validation
             if len(self.params) > 0 and self.params[0].value:
-                output_name = str(self.params[0].value)
+                name_lc = str(self.params[0].value).lower()
+                # Re-scan keywords only when the output name changed
+                if name_lc != self._last_warning_key:
+                    self._last_warning_key = name_lc
+                    self._last_needs_warning = not any(
+                        keyword in name_lc for keyword in self._VALID_KEYWORDS
+                    )
                 # Provide guidance for IMPORT_FIELDS validation context
-                if not any(
-                    keyword in output_name.lower()
-                    for keyword in ["validated", "checked", "import"]
-                ):
+                if self._last_needs_warning:
                     self.params[0].setWarningMessage(
                         "Phase 2: This tool validates IMPORT_FIELDS compatibility. Consider output name indicating validation (e.g., '_validated', '_import_checked')"
                     )
@@ -275,56 +294,56 @@ def generate_memory_labels(avail_gb):
 
 # IMPORT_FIELDS definition for Phase 2 validation (from IMPORT_FIELDS.md)
 IMPORT_FIELDS = {
-    "Age Data": [
+    "Age Data": (
         "srrhogstaar",  # Harvest year
         "srrtrealder",  # Stand age
         "srrtrealder_l",  # Stand age lower bound
         "srrtrealder_u",  # Stand age upper bound
-    ],
-    "Species Type": [
+    ),
+    "Species Type": (
         "srrtreslag",  # Dominant species
-    ],
-    "Biomass": [
+    ),
+    "Biomass": (
         "srrbmo",  # Above-ground biomass (t/ha)
         "srrbmo_l",  # Above-ground biomass lower bound (t/ha)
         "srrbmo_u",  # Above-ground biomass upper bound (t/ha)
         "srrbmu",  # Below-ground biomass (t/ha)
         "srrbmu_l",  # Below-ground biomass lower bound (t/ha)
         "srrbmu_u",  # Below-ground biomass upper bound (t/ha)
-    ],
-    "Volume": [
+    ),
+    "Volume": (
         "srrvolmb",  # Volume over bark (m³/ha)
         "srrvolmb_l",  # Volume over bark lower bound (m³/ha)
         "srrvolmb_u",  # Volume over bark upper bound (m³/ha)
         "srrvolub",  # Volume under bark (m³/ha)
         "srrvolub_l",  # Volume under bark lower bound (m³/ha)
         "srrvolub_u",  # Volume under bark upper bound (m³/ha)
-    ],
-    "Height": [
+    ),
+    "Height": (
         "srrmhoyde",  # Mean height (m)
         "srrmhoyde_l",  # Mean height lower bound (m)
         "srrmhoyde_u",  # Mean height upper bound (m)
         "srrohoyde",  # Top height (m)
         "srrohoyde_l",  # Top height lower bound (m)
         "srrohoyde_u",  # Top height upper bound (m)
-    ],
-    "Site Index": [
+    ),
+    "Site Index": (
         "srrbonitet",  # Site index (bonitet)
-    ],
-    "Diameter": [
+    ),
+    "Diameter": (
         "srrdiammiddel",  # Mean DBH (cm)
         "srrdiammiddel_l",  # Mean DBH lower bound (cm)
         "srrdiammiddel_u",  # Mean DBH upper bound (cm)
         "srrdiammiddel_ge8",  # Mean DBH ≥ 8 cm (cm)
         "srrdiammiddel_ge8_l",  # Mean DBH ≥ 8 cm lower bound (cm)
         "srrdiammiddel_ge8_u",  # Mean DBH ≥ 8 cm upper bound (cm)
-    ],
-    "Basal Area": [
+    ),
+    "Basal Area": (
         "srrgrflate",  # Basal area (m²/ha)
         "srrgrflate_l",  # Basal area lower bound (m²/ha)
         "srrgrflate_u",  # Basal area upper bound (m²/ha)
-    ],
-    "Tree Density": [
+    ),
+    "Tree Density": (
         "srrtreantall",  # Trees per hectare (all)
         "srrtreantall_l",  # Trees per hectare lower bound (all)
         "srrtreantall_u",  # Trees per hectare upper bound (all)
@@ -337,38 +356,50 @@ IMPORT_FIELDS = {
         "srrtreantall_ge16",  # Trees per hectare ≥ 16 cm DBH
         "srrtreantall_ge16_l",  # Trees per hectare ≥ 16 cm lower bound
         "srrtreantall_ge16_u",  # Trees per hectare ≥ 16 cm upper bound
-    ],
-    "Leaf Area Index": [
+    ),
+    "Leaf Area Index": (
         "srrlai",  # Leaf Area Index
         "srrlai_l",  # Leaf Area Index lower bound
         "srrlai_u",  # Leaf Area Index upper bound
-    ],
-    "Crown Coverage": [
+    ),
+    "Crown Coverage": (
         "srrkronedek",  # Crown coverage (%)
-    ],
-    "Elevation": [
+    ),
+    "Elevation": (
         "elev_min",  # Minimum elevation (m)
         "elev_mean",  # Mean elevation (m)
         "elev_max",  # Maximum elevation (m)
-    ],
-    "Soil Properties": [
+    ),
+    "Soil Properties": (
         "markfukt",  # Soil moisture classification
         "artype",  # Soil type classification
         "argrunnf",  # Soil depth / foundation
-    ],
-    "Location": [
+    ),
+    "Location": (
         "loc_long",  # Longitude
         "loc_lat",  # Latitude
-    ],
+    ),
 }
 
 
+# Total number of IMPORT_FIELDS across all categories
+_IMPORT_FIELDS_TOTAL = sum(len(fields) for fields in IMPORT_FIELDS.values())
+
+# Flat (lowercase name, original name, category) rows for single-pass validation
+_FLAT_FIELDS = tuple(
+    (field.lower(), field, category)
+    for category, fields in IMPORT_FIELDS.items()
+    for field in fields
+)
+
+# Critical fields (already lowercase) - at least 2 must be present
+_CRITICAL_FIELDS = ("srrtreslag", "srrbmo", "srrmhoyde", "srrvolmb")
+
+
 def validate_import_fields(layer_names):
     """Phase 2 Addition: Validate IMPORT_FIELDS availability in layers."""
     validation_results = {
-        "total_fields": len(
-            [field for fields in IMPORT_FIELDS.values() for field in fields]
-        ),
+        "total_fields": _IMPORT_FIELDS_TOTAL,
         "found_fields": 0,
         "missing_fields": [],
         "layers_checked": len(layer_names) if layer_names else 0,
@@ -400,80 +431,58 @@ def validate_import_fields_detailed(output_layer):
     if output_layer is None:
         raise Exception("No output layer specified for validation")
 
+    import arcpy  # Deferred import to prevent pytest crashes
+
+    # Get field list from the layer if it exists
     try:
-        import arcpy
-
-        # Initialize validation results
-        validation_results = {
-            "total_fields": len(
-                [field for fields in IMPORT_FIELDS.values() for field in fields]
-            ),
-            "found_fields": 0,
-            "missing_fields": [],
-            "categories_validated": 0,
-            "validation_passed": False,
-            "critical_fields_found": [],
-            "critical_fields_missing": [],
-        }
-
-        # Get field list from the layer if it exists
-        try:
-            if arcpy.Exists(output_layer):
-                existing_fields = [
-                    f.name.lower() for f in arcpy.ListFields(output_layer)
-                ]
-            else:
-                existing_fields = []
-        except Exception:
-            existing_fields = []
-
-        # Check each category
-        for category, fields in IMPORT_FIELDS.items():
-            category_found = 0
-            for field in fields:
-                if field.lower() in existing_fields:
-                    validation_results["found_fields"] += 1
-                    category_found += 1
-                else:
-                    validation_results["missing_fields"].append(field)
-
-            if category_found > 0:
-                validation_results["categories_validated"] += 1
-
-        # Check critical fields
-        critical_fields = ["srrtreslag", "srrbmo", "srrmhoyde", "srrvolmb"]
-        for field in critical_fields:
-            if field.lower() in existing_fields:
-                validation_results["critical_fields_found"].append(field)
-            else:
-                validation_results["critical_fields_missing"].append(field)
-
-        # Determine if validation passed (require at least 2 critical fields)
-        critical_found_count = len(validation_results["critical_fields_found"])
-        if critical_found_count >= 2:
-            validation_results["validation_passed"] = True
-        else:
-            validation_results["validation_passed"] = False
-            # Raise exception for failed validation as tests expect
-            missing_critical = validation_results["critical_fields_missing"]
-            raise Exception(
-                f"IMPORT_FIELDS validation failed - Missing critical fields: {', '.join(missing_critical)}"
+        if arcpy.Exists(output_layer):
+            existing_fields = frozenset(
+                f.name.lower() for f in arcpy.ListFields(output_layer)
             )
+        else:
+            existing_fields = frozenset()
+    except Exception:
+        existing_fields = frozenset()
+
+    # Classify critical fields up front against the same field set
+    critical_found = [f for f in _CRITICAL_FIELDS if f in existing_fields]
+    critical_missing = [f for f in _CRITICAL_FIELDS if f not in existing_fields]
+
+    # Fail before the category scan (require at least 2 critical fields);
+    # this also covers a missing layer, where no fields exist at all
+    if len(critical_found) < 2:
+        # Raise exception for failed validation as tests expect
+        raise Exception(
+            f"IMPORT_FIELDS validation failed - Missing critical fields: {', '.join(critical_missing)}"
+        )
+
+    # Single pass over every field (accumulate in locals, build the result once)
+    missing = []
+    found_count = 0
+    cats_with_hits = set()
+    for field_lower, field, category in _FLAT_FIELDS:
+        if field_lower in existing_fields:
+            found_count += 1
+            cats_with_hits.add(category)
+        else:
+            missing.append(field)
 
-        return validation_results
-
-    except Exception as e:
-        # Re-raise exceptions instead of returning error dict for test compatibility
-        raise e
+    return {
+        "total_fields": _IMPORT_FIELDS_TOTAL,
+        "found_fields": found_count,
+        "missing_fields": missing,
+        "categories_validated": len(cats_with_hits),
+        "validation_passed": True,
+        "critical_fields_found": critical_found,
+        "critical_fields_missing": critical_missing,
+    }
 
 
 def get_phase2_validation_info():
     """Phase 2 Addition: Get information about IMPORT_FIELDS validation."""
     return {
         "field_categories": list(IMPORT_FIELDS.keys()),
-        "total_fields": len(
-            [field for fields in IMPORT_FIELDS.values() for field in fields]
-        ),
+        "total_fields": _IMPORT_FIELDS_TOTAL,
         "validation_focus": "Norwegian forest data compatibility",
-        "critical_fields": ["srrtreslag", "srrbmo", "srrmhoyde", "srrvolmb"],
+        "critical_fields": list(_CRITICAL_FIELDS),
     }
@@ -7,12 +7,15 @@ Created: 2025-08-30
 """
 
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, call
+from types import SimpleNamespace
 import sys
 import os
 
 # Add the src directory to the path for importing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "src"))
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "src"))
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 try:
     from execution.toolbox_0_1.toolbox_0_1_12 import (
@@ -29,12 +32,37 @@ except ImportError as e:
     raise
 
 
+# Shared, never-mutated parameter inputs, built once at import time
+_PARAMS_BASIC = (SimpleNamespace(), SimpleNamespace(), SimpleNamespace())
+_MESSAGES_BASIC = SimpleNamespace()
+_MAIN_PARAMS_BASIC = (
+    "test_output_layer",
+    "Auto (let system decide)",
+    "8 GB (60% of 16.0 GB available)",
+)
+_MAIN_PARAMS_EMPTY = ("", "", "")
+
+# One arcpy stand-in for the whole module, reset before each use
+_FAKE_ARCPY = Mock()
+
+
+def _fresh_arcpy():
+    """Return the shared arcpy stand-in with call history and stubs cleared."""
+    _FAKE_ARCPY.reset_mock(return_value=True, side_effect=True)
+    return _FAKE_ARCPY
+
+
 class TestForestClassificationToolbox(unittest.TestCase):
     """Test ForestClassificationToolbox class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one toolbox shared by all tests; none of them mutate it."""
+        cls.toolbox = ForestClassificationToolbox()
+
     def test_toolbox_initialization(self):
         """Test toolbox initialization."""
-        toolbox = ForestClassificationToolbox()
+        toolbox = self.toolbox
         
         # Verify basic properties
         self.assertEqual(toolbox.label, "Forest Classification Toolbox - Phase 1 v0.1.12")
@@ -47,7 +75,7 @@ class TestForestClassificationToolbox(unittest.TestCase):
 
     def test_toolbox_attributes_exist(self):
         """Test that all required toolbox attributes exist."""
-        toolbox = ForestClassificationToolbox()
+        toolbox = self.toolbox
         
         required_attrs = ["label", "alias", "description", "tools"]
         for attr in required_attrs:
@@ -58,9 +86,10 @@ class TestForestClassificationToolbox(unittest.TestCase):
 class TestForestClassificationTool(unittest.TestCase):
     """Test ForestClassificationTool class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.tool = ForestClassificationTool()
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared fixtures; the tool is stateless and never mutated."""
+        cls.tool = ForestClassificationTool()
 
     def test_tool_initialization(self):
         """Test tool initialization."""
@@ -84,27 +113,20 @@ class TestForestClassificationTool(unittest.TestCase):
 
     def test_update_parameters(self):
         """Test parameter updates."""
-        mock_params = [Mock(), Mock(), Mock()]
-        
         # Should not raise exceptions and return None
-        result = self.tool.updateParameters(mock_params)
+        result = self.tool.updateParameters(_PARAMS_BASIC)
         self.assertIsNone(result)
 
     def test_update_messages(self):
         """Test message updates."""
-        mock_params = [Mock(), Mock(), Mock()]
-        
         # Should not raise exceptions and return None
-        result = self.tool.updateMessages(mock_params)
+        result = self.tool.updateMessages(_PARAMS_BASIC)
         self.assertIsNone(result)
 
-    @patch('execution.toolbox_0_1.toolbox_0_1_12.main')
+    @patch('execution.toolbox_0_1.toolbox_0_1_12.main', new_callable=Mock)
     def test_execute(self, mock_main):
         """Test tool execution."""
-        mock_params = [Mock(), Mock(), Mock()]
-        mock_messages = Mock()
-        
-        result = self.tool.execute(mock_params, mock_messages)
+        result = self.tool.execute(_PARAMS_BASIC, _MESSAGES_BASIC)
         
         # Should call main function
         mock_main.assert_called_once()
@@ -123,24 +145,21 @@ class TestForestClassificationTool(unittest.TestCase):
             "postExecute"
         ]
         
-        for method_name in required_methods:
-            self.assertTrue(hasattr(self.tool, method_name))
-            self.assertTrue(callable(getattr(self.tool, method_name)))
+        # One merged class namespace instead of a hasattr/getattr probe per name
+        namespace = {}
+        for cls in reversed(type(self.tool).__mro__):
+            namespace.update(vars(cls))
+        missing = [name for name in required_methods if not callable(namespace.get(name))]
+        self.assertFalse(missing, f"missing: {missing}")
 
-    @patch('builtins.__import__')
-    def test_get_parameter_info(self, mock_import):
+    @patch.dict('sys.modules')
+    def test_get_parameter_info(self):
         """Test parameter information setup."""
         # Mock arcpy module
-        mock_arcpy = Mock()
+        mock_arcpy = _fresh_arcpy()
         mock_param = Mock()
         mock_arcpy.Parameter.return_value = mock_param
-        
-        def import_side_effect(name, *args, **kwargs):
-            if name == "arcpy":
-                return mock_arcpy
-            return __import__(name, *args, **kwargs)
-        
-        mock_import.side_effect = import_side_effect
+        sys.modules["arcpy"] = mock_arcpy
         
         params = self.tool.getParameterInfo()
         
@@ -150,22 +169,14 @@ class TestForestClassificationTool(unittest.TestCase):
         # Verify Parameter constructor was called 3 times
         self.assertEqual(mock_arcpy.Parameter.call_count, 3)
 
-    @patch('builtins.__import__')
-    def test_post_execute(self, mock_import):
+    @patch.dict('sys.modules')
+    def test_post_execute(self):
         """Test post-execution cleanup."""
         # Mock arcpy module
-        mock_arcpy = Mock()
-        
-        def import_side_effect(name, *args, **kwargs):
-            if name == "arcpy":
-                return mock_arcpy
-            return __import__(name, *args, **kwargs)
+        mock_arcpy = _fresh_arcpy()
+        sys.modules["arcpy"] = mock_arcpy
         
-        mock_import.side_effect = import_side_effect
-        
-        mock_params = [Mock(), Mock(), Mock()]
-        
-        result = self.tool.postExecute(mock_params)
+        result = self.tool.postExecute(_PARAMS_BASIC)
         
         # Should log cleanup message
         mock_arcpy.AddMessage.assert_called_once_with("🧹 Phase 1 post-execution cleanup completed")
@@ -174,129 +185,131 @@ class TestForestClassificationTool(unittest.TestCase):
         self.assertIsNone(result)
 
 
+@patch.dict('sys.modules')
 class TestMainFunction(unittest.TestCase):
     """Test main execution function."""
 
-    @patch('builtins.__import__')
-    def test_main_execution_complete(self, mock_import):
+    @classmethod
+    def setUpClass(cls):
+        """Patch log_system_capabilities once for the whole class."""
+        cls._log_patcher = patch(
+            'execution.toolbox_0_1.toolbox_0_1_12.log_system_capabilities', new_callable=Mock
+        )
+        cls.mock_log = cls._log_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the class patch."""
+        cls._log_patcher.stop()
+
+    def setUp(self):
+        """Clear the shared log_system_capabilities mock between tests."""
+        self.mock_log.reset_mock()
+
+    def test_main_execution_complete(self):
         """Test complete main function execution."""
         # Mock arcpy module
-        mock_arcpy = Mock()
-        mock_arcpy.GetParameterAsText.side_effect = [
-            "test_output_layer",
-            "Auto (let system decide)", 
-            "8 GB (60% of 16.0 GB available)"
-        ]
+        mock_arcpy = _fresh_arcpy()
+        mock_arcpy.GetParameterAsText.side_effect = _MAIN_PARAMS_BASIC
+        sys.modules["arcpy"] = mock_arcpy
         
-        def import_side_effect(name, *args, **kwargs):
-            if name == "arcpy":
-                return mock_arcpy
-            return __import__(name, *args, **kwargs)
+        main()
         
-        mock_import.side_effect = import_side_effect
+        # Verify parameter extraction
+        self.assertEqual(mock_arcpy.GetParameterAsText.call_count, 3)
         
-        with patch('execution.toolbox_0_1.toolbox_0_1_12.log_system_capabilities') as mock_log:
-            main()
-            
-            # Verify parameter extraction
-            self.assertEqual(mock_arcpy.GetParameterAsText.call_count, 3)
-            
-            # Verify system capabilities logging was called
-            mock_log.assert_called_once()
-            
-            # Verify key messages were logged
-            mock_arcpy.AddMessage.assert_any_call("🚀 Starting Forest Classification Tool v0.1.12")
-            mock_arcpy.AddMessage.assert_any_call("✅ Phase 1 completed successfully!")
+        # Verify system capabilities logging was called
+        self.mock_log.assert_called_once()
+        
+        # Verify key messages were logged
+        mock_arcpy.AddMessage.assert_has_calls(
+            [
+                call("🚀 Starting Forest Classification Tool v0.1.12"),
+                call("✅ Phase 1 completed successfully!"),
+            ],
+            any_order=True,
+        )
 
-    @patch('builtins.__import__')
-    def test_main_with_empty_parameters(self, mock_import):
+    def test_main_with_empty_parameters(self):
         """Test main function with empty parameters."""
         # Mock arcpy module
-        mock_arcpy = Mock()
-        mock_arcpy.GetParameterAsText.side_effect = ["", "", ""]
-        
-        def import_side_effect(name, *args, **kwargs):
-            if name == "arcpy":
-                return mock_arcpy
-            return __import__(name, *args, **kwargs)
+        mock_arcpy = _fresh_arcpy()
+        mock_arcpy.GetParameterAsText.side_effect = _MAIN_PARAMS_EMPTY
+        sys.modules["arcpy"] = mock_arcpy
         
-        mock_import.side_effect = import_side_effect
+        main()
         
-        with patch('execution.toolbox_0_1.toolbox_0_1_12.log_system_capabilities'):
-            main()
-            
-            # Verify empty parameter logging
-            mock_arcpy.AddMessage.assert_any_call("📊 Output layer: ")
-            mock_arcpy.AddMessage.assert_any_call("🧵 Thread configuration: ")
-            mock_arcpy.AddMessage.assert_any_call("💾 Memory configuration: ")
+        # Verify empty parameter logging
+        mock_arcpy.AddMessage.assert_has_calls(
+            [
+                call("📊 Output layer: "),
+                call("🧵 Thread configuration: "),
+                call("💾 Memory configuration: "),
+            ],
+            any_order=True,
+        )
 
 
+@patch.dict('sys.modules')
 class TestLogSystemCapabilities(unittest.TestCase):
     """Test system capabilities logging function."""
 
-    @patch('builtins.__import__')
-    def test_log_system_capabilities_basic(self, mock_import):
+    @classmethod
+    def setUpClass(cls):
+        """Wire the psutil stand-in once; no call assertions are made on it."""
+        mock_memory = SimpleNamespace(
+            available=8 * (1024**3),  # 8 GB available
+            total=16 * (1024**3),  # 16 GB total
+        )
+        cls._mock_psutil_8gb_16gb = SimpleNamespace(
+            virtual_memory=lambda: mock_memory
+        )
+
+    def test_log_system_capabilities_basic(self):
         """Test basic system capabilities logging."""
         # Mock arcpy module
-        mock_arcpy = Mock()
-        
-        def import_side_effect(name, *args, **kwargs):
-            if name == "arcpy":
-                return mock_arcpy
-            elif name == "psutil":
-                raise ImportError("No psutil")
-            return __import__(name, *args, **kwargs)
-        
-        mock_import.side_effect = import_side_effect
+        mock_arcpy = _fresh_arcpy()
+        sys.modules["arcpy"] = mock_arcpy
+        sys.modules["psutil"] = None  # makes "import psutil" raise ImportError
         
-        with patch('execution.toolbox_0_1.toolbox_0_1_12.os.cpu_count', return_value=4):
+        with patch('execution.toolbox_0_1.toolbox_0_1_12.os.cpu_count', new_callable=Mock, return_value=4):
             log_system_capabilities()
             
             # Should log CPU detection
-            mock_arcpy.AddMessage.assert_any_call("🖥️ System: 4 CPU cores detected")
-            mock_arcpy.AddMessage.assert_any_call("🧵 System: Maximum recommended threads: 3 (90% of 4 cores)")
-
-    @patch('builtins.__import__')
-    def test_log_system_capabilities_with_psutil(self, mock_import):
+            mock_arcpy.AddMessage.assert_has_calls(
+                [
+                    call("🖥️ System: 4 CPU cores detected"),
+                    call("🧵 System: Maximum recommended threads: 3 (90% of 4 cores)"),
+                ],
+                any_order=True,
+            )
+
+    def test_log_system_capabilities_with_psutil(self):
         """Test system capabilities logging with psutil."""
-        # Mock arcpy and psutil modules
-        mock_arcpy = Mock()
-        mock_psutil = Mock()
-        mock_memory = Mock()
-        mock_memory.available = 8 * (1024**3)  # 8 GB available
-        mock_memory.total = 16 * (1024**3)  # 16 GB total
-        mock_psutil.virtual_memory.return_value = mock_memory
-        
-        def import_side_effect(name, *args, **kwargs):
-            if name == "arcpy":
-                return mock_arcpy
-            elif name == "psutil":
-                return mock_psutil
-            return __import__(name, *args, **kwargs)
-        
-        mock_import.side_effect = import_side_effect
+        # Mock arcpy; psutil is the prebuilt class-level stand-in
+        mock_arcpy = _fresh_arcpy()
+        sys.modules["arcpy"] = mock_arcpy
+        sys.modules["psutil"] = self._mock_psutil_8gb_16gb
         
-        with patch('execution.toolbox_0_1.toolbox_0_1_12.os.cpu_count', return_value=8):
+        with patch('execution.toolbox_0_1.toolbox_0_1_12.os.cpu_count', new_callable=Mock, return_value=8):
             log_system_capabilities()
             
             # Should log both CPU and memory
-            mock_arcpy.AddMessage.assert_any_call("🖥️ System: 8 CPU cores detected")
-            mock_arcpy.AddMessage.assert_any_call("💾 System: 8.0 GB available RAM (16.0 GB total)")
-
-    @patch('builtins.__import__')
-    def test_log_system_capabilities_exception(self, mock_import):
+            mock_arcpy.AddMessage.assert_has_calls(
+                [
+                    call("🖥️ System: 8 CPU cores detected"),
+                    call("💾 System: 8.0 GB available RAM (16.0 GB total)"),
+                ],
+                any_order=True,
+            )
+
+    def test_log_system_capabilities_exception(self):
         """Test system capabilities logging with exception."""
         # Mock arcpy module
-        mock_arcpy = Mock()
-        
-        def import_side_effect(name, *args, **kwargs):
-            if name == "arcpy":
-                return mock_arcpy
-            return __import__(name, *args, **kwargs)
+        mock_arcpy = _fresh_arcpy()
+        sys.modules["arcpy"] = mock_arcpy
         
-        mock_import.side_effect = import_side_effect
-        
-        with patch('execution.toolbox_0_1.toolbox_0_1_12.os.cpu_count', side_effect=Exception("CPU error")):
+        with patch('execution.toolbox_0_1.toolbox_0_1_12.os.cpu_count', new_callable=Mock, side_effect=Exception("CPU error")):
             log_system_capabilities()
             
             # Should log exception
@@ -321,19 +334,10 @@ class TestCoverageEdgeCases(unittest.TestCase):
 
     def test_os_cpu_count_none_fallback(self):
         """Test CPU count fallback when os.cpu_count returns None."""
-        with patch('execution.toolbox_0_1.toolbox_0_1_12.os.cpu_count', return_value=None):
-            with patch('builtins.__import__') as mock_import:
-                mock_arcpy = Mock()
-                
-                def import_side_effect(name, *args, **kwargs):
-                    if name == "arcpy":
-                        return mock_arcpy
-                    elif name == "psutil":
-                        raise ImportError("No psutil")
-                    return __import__(name, *args, **kwargs)
-                
-                mock_import.side_effect = import_side_effect
-                
+        with patch('execution.toolbox_0_1.toolbox_0_1_12.os.cpu_count', new_callable=Mock, return_value=None):
+            mock_arcpy = _fresh_arcpy()
+            # None in sys.modules makes "import psutil" raise ImportError
+            with patch.dict('sys.modules', {"arcpy": mock_arcpy, "psutil": None}):
                 log_system_capabilities()
                 
                 # Should fallback to 4 cores
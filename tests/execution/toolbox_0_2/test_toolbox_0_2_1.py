@@ -23,12 +23,13 @@ from unittest.mock import patch, MagicMock
 # Import the validation module
 import sys
 
-sys.path.insert(
-    0,
+toolbox_path = os.path.abspath(
     os.path.join(
         os.path.dirname(__file__), "..", "..", "..", "src", "execution", "toolbox_0_2"
-    ),
+    )
 )
+if toolbox_path not in sys.path:
+    sys.path.insert(0, toolbox_path)
 from toolbox_0_2_1 import (
     load_import_fields_json,
     get_required_input_datasets,
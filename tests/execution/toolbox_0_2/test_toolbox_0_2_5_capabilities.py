@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for Phase 2 System Capability Detection - v0.2.5
+
+Tests get_system_capabilities() in toolbox_0_2_5.py, which sizes the thread and
+memory configuration logged by main().
+
+Test Coverage:
+- Single psutil probe per session, reused across calls
+- Fresh probe after _detect_system_capabilities.cache_clear()
+- Uncached fallback values when the probe fails
+- Read-only capabilities mapping
+"""
+
+import unittest
+import os
+from unittest.mock import patch, Mock
+
+# Import the toolbox module
+import sys
+
+toolbox_path = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__), "..", "..", "..", "src", "execution", "toolbox_0_2"
+    )
+)
+if toolbox_path not in sys.path:
+    sys.path.insert(0, toolbox_path)
+from toolbox_0_2_5 import (
+    get_system_capabilities,
+    _detect_system_capabilities,
+)
+
+
+class TestSystemCapabilities(unittest.TestCase):
+    """Test suite for cached system capability detection."""
+
+    def setUp(self):
+        """Start every test from an empty detection cache."""
+        _detect_system_capabilities.cache_clear()
+
+    def test_get_system_capabilities_detects_once(self):
+        """Test that system capabilities are probed once and then cached."""
+        mock_psutil = Mock()
+        mock_psutil.cpu_count.return_value = 10
+        mock_psutil.virtual_memory.return_value.total = 32 * (1024**3)
+
+        with patch.dict("sys.modules", {"psutil": mock_psutil}):
+            first = get_system_capabilities()
+            second = get_system_capabilities()
+
+        self.assertIs(first, second)
+        self.assertEqual(first["cpu_count"], 10)
+        self.assertEqual(first["memory_gb"], 32)
+        self.assertEqual(first["max_threads"], 9)
+        self.assertEqual(first["max_memory_gb"], 28)
+        mock_psutil.cpu_count.assert_called_once_with(logical=True)
+        mock_psutil.virtual_memory.assert_called_once_with()
+
+    def test_get_system_capabilities_cache_clear(self):
+        """Test that cache_clear forces a fresh capability probe."""
+        mock_psutil = Mock()
+        mock_psutil.cpu_count.return_value = 4
+        mock_psutil.virtual_memory.return_value.total = 16 * (1024**3)
+
+        with patch.dict("sys.modules", {"psutil": mock_psutil}):
+            get_system_capabilities()
+            _detect_system_capabilities.cache_clear()
+            mock_psutil.cpu_count.return_value = 8
+            result = get_system_capabilities()
+
+        self.assertEqual(result["cpu_count"], 8)
+        self.assertEqual(mock_psutil.cpu_count.call_count, 2)
+
+    def test_get_system_capabilities_fallback_not_cached(self):
+        """Test that a failed probe falls back without pinning the fallback."""
+        mock_psutil = Mock()
+        mock_psutil.cpu_count.side_effect = [OSError("probe failed"), 12]
+        mock_psutil.virtual_memory.return_value.total = 64 * (1024**3)
+
+        with patch.dict("sys.modules", {"psutil": mock_psutil}):
+            fallback = get_system_capabilities()
+            recovered = get_system_capabilities()
+
+        self.assertEqual(fallback["cpu_count"], 4)
+        self.assertEqual(fallback["memory_gb"], 8)
+        self.assertEqual(recovered["cpu_count"], 12)
+        self.assertEqual(recovered["memory_gb"], 64)
+
+    def test_get_system_capabilities_read_only(self):
+        """Test that the shared capabilities mapping cannot be mutated."""
+        mock_psutil = Mock()
+        mock_psutil.cpu_count.return_value = 4
+        mock_psutil.virtual_memory.return_value.total = 16 * (1024**3)
+
+        with patch.dict("sys.modules", {"psutil": mock_psutil}):
+            result = get_system_capabilities()
+
+        with self.assertRaises(TypeError):
+            result["cpu_count"] = 64
+
+        # The fallback mapping is shared too, so it is read-only as well
+        with patch.dict("sys.modules", {"psutil": None}):
+            _detect_system_capabilities.cache_clear()
+            fallback = get_system_capabilities()
+        with self.assertRaises(TypeError):
+            fallback["cpu_count"] = 64
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,8 +16,9 @@ import os
 import importlib.util
 
 # Add the src directory to the path for importing
-src_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", "src")
-sys.path.insert(0, os.path.abspath(src_path))
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "src"))
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 # Mock arcpy at the system level before importing the module
 mock_arcpy = MagicMock()
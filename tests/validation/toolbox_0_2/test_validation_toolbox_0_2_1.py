@@ -14,8 +14,9 @@ import sys
 import os
 
 # Add the src directory to the path for importing
-src_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", "src")
-sys.path.insert(0, os.path.abspath(src_path))
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "src"))
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 # Import validation module with real ArcPy (no mocking)
 try:
@@ -11,12 +11,14 @@ Author: Forest Classification Development Team
 """
 
 import unittest
+from unittest.mock import Mock, patch
 import sys
 import os
 
 # Add the src directory to the path for importing
-src_path = os.path.join(os.path.dirname(__file__), "..", "..", "..", "src")
-sys.path.insert(0, os.path.abspath(src_path))
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "src"))
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 # Import validation module with real ArcPy (no mocking)
 try:
@@ -76,11 +78,11 @@ class TestImportFieldsValidation(unittest.TestCase):
         self.assertIsInstance(IMPORT_FIELDS, dict)
         self.assertGreater(len(IMPORT_FIELDS), 0)
 
-        # Verify all category keys are strings and values are lists
+        # Verify all category keys are strings and values are tuples
         for category, fields in IMPORT_FIELDS.items():
             self.assertIsInstance(category, str)
             self.assertGreater(len(category), 0)
-            self.assertIsInstance(fields, list)
+            self.assertIsInstance(fields, tuple)
             self.assertGreater(len(fields), 0)
 
             # Verify all field names are strings
@@ -200,5 +202,152 @@ class TestSystemHelpers(unittest.TestCase):
                 self.assertIn(str(aggressive), labels[2])
 
 
+class TestToolValidatorLifecycle(unittest.TestCase):
+    """Test ToolValidator lifecycle methods with a mocked ArcPy project."""
+
+    def setUp(self):
+        """Set up mock parameters, project and map for a fresh validator."""
+        # Create mock parameters with filter and value attributes
+        self.mock_params = []
+        for i in range(3):
+            param = Mock()
+            param.filter = Mock()
+            param.filter.list = []
+            param.value = None
+            self.mock_params.append(param)
+
+        self.mock_map = Mock()
+        self.mock_map.listLayers.return_value = [
+            self._layer("Forest_Stands"),
+            self._layer("Hillshade", is_feature=False),
+        ]
+        self.mock_project = Mock()
+        self.mock_project.activeMap = self.mock_map
+
+        self.mock_arcpy = Mock()
+        self.mock_arcpy.GetParameterInfo.return_value = self.mock_params
+        self.mock_arcpy.mp.ArcGISProject.return_value = self.mock_project
+
+        # ToolValidator imports arcpy once, in __init__
+        with patch.dict("sys.modules", {"arcpy": self.mock_arcpy}):
+            self.validator = ToolValidator()
+
+    @staticmethod
+    def _layer(name, is_feature=True):
+        """Build a mock map layer."""
+        layer = Mock()
+        layer.name = name
+        layer.isFeatureLayer = is_feature
+        return layer
+
+    def test_initialize_parameters_sets_defaults(self):
+        """Test initialization fills dropdowns with Auto/balanced defaults."""
+        self.validator.initializeParameters()
+
+        self.assertEqual(len(self.mock_params[1].filter.list), 3)
+        self.assertEqual(len(self.mock_params[2].filter.list), 3)
+        self.assertEqual(self.mock_params[1].value, self.mock_params[1].filter.list[0])
+        self.assertEqual(self.mock_params[2].value, self.mock_params[2].filter.list[1])
+        self.assertEqual(self.mock_params[0].filter.list, ["Forest_Stands"])
+        self.assertEqual(self.mock_params[0].value, "Forest_Stands")
+
+    def test_update_parameters_preserves_selection(self):
+        """Test user dropdown selections survive updateParameters."""
+        self.validator.initializeParameters()
+        thread_list = self.mock_params[1].filter.list
+        memory_list = self.mock_params[2].filter.list
+        self.mock_params[1].value = thread_list[2]
+        self.mock_params[2].value = memory_list[0]
+
+        self.validator.updateParameters()
+
+        self.assertEqual(self.mock_params[1].value, thread_list[2])
+        self.assertEqual(self.mock_params[2].value, memory_list[0])
+        # Filter lists are assigned once and left untouched afterwards
+        self.assertIs(self.mock_params[1].filter.list, thread_list)
+        self.assertIs(self.mock_params[2].filter.list, memory_list)
+
+    def test_update_parameters_maps_stale_selection(self):
+        """Test stale selections map to the equivalent option by pattern."""
+        self.validator.initializeParameters()
+        self.mock_params[1].value = "High - 99 threads (90% utilization)"
+        self.mock_params[2].value = "1 GB (30% of 2.0 GB available)"
+
+        self.validator.updateParameters()
+
+        self.assertEqual(self.mock_params[1].value, self.mock_params[1].filter.list[2])
+        self.assertEqual(self.mock_params[2].value, self.mock_params[2].filter.list[0])
+
+    def test_update_parameters_without_initialize(self):
+        """Test updateParameters assigns the filter lists when still unset."""
+        self.validator.updateParameters()
+
+        self.assertEqual(len(self.mock_params[1].filter.list), 3)
+        self.assertEqual(len(self.mock_params[2].filter.list), 3)
+
+    def test_update_parameters_refreshes_layers_across_calls(self):
+        """Test the layer dropdown follows the project's current active map."""
+        self.validator.initializeParameters()
+
+        # User switches to another map between validation events
+        other_map = Mock()
+        other_map.listLayers.return_value = [self._layer("Soil_Types")]
+        self.mock_project.activeMap = other_map
+        self.validator.updateParameters()
+        self.assertEqual(self.mock_params[0].filter.list, ["Soil_Types"])
+
+        # Layers added to the active map show up on the next event
+        other_map.listLayers.return_value = [
+            self._layer("Soil_Types"),
+            self._layer("Elevation"),
+        ]
+        self.validator.updateParameters()
+        self.assertEqual(self.mock_params[0].filter.list, ["Soil_Types", "Elevation"])
+
+        # The project itself is only looked up once
+        self.mock_arcpy.mp.ArcGISProject.assert_called_once_with("CURRENT")
+
+    def test_update_parameters_no_project(self):
+        """Test updateParameters when no ArcGIS Pro project is open."""
+        self.mock_arcpy.mp.ArcGISProject.side_effect = Exception("No project")
+
+        self.validator.updateParameters()
+
+        self.assertEqual(self.mock_params[0].filter.list, [])
+        self.assertEqual(len(self.mock_params[1].filter.list), 3)
+
+    def test_update_messages_warning_follows_output_name(self):
+        """Test the naming warning is set or cleared as the output name changes."""
+        warn = self.mock_params[0].setWarningMessage
+
+        self.mock_params[0].value = "forest_output"
+        self.validator.updateMessages()
+        self.assertEqual(warn.call_count, 1)
+
+        # Same name again: the warning is re-issued on every validation pass
+        self.validator.updateMessages()
+        self.assertEqual(warn.call_count, 2)
+
+        warn.reset_mock()
+        self.mock_params[0].value = "forest_validated"
+        self.validator.updateMessages()
+        warn.assert_not_called()
+
+        self.mock_params[0].value = "Forest_Output"
+        self.validator.updateMessages()
+        warn.assert_called_once()
+
+    def test_update_messages_no_output(self):
+        """Test no warning is issued without an output name."""
+        self.validator.updateMessages()
+        self.mock_params[0].setWarningMessage.assert_not_called()
+
+    def test_validator_uses_slots(self):
+        """Test ToolValidator rejects attributes outside its declared slots."""
+        self.assertFalse(hasattr(self.validator, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.validator.unexpected_attribute = True
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)